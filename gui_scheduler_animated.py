@@ -2,8 +2,34 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from scheduler_code import Process, ProcessScheduler, generate_random_processes
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import random, threading, time
+from matplotlib.colors import to_rgba
+from matplotlib.transforms import Bbox
+import queue, re, threading, time
+
+BASE_DELAY = 0.15  # seconds per animated time unit at 1x speed
+FRAME_INTERVAL = 1 / 60  # never draw faster than a typical display refresh
+Y_CPU, Y_PROCESS = 5, 10  # row centres of the IDLE and process bars
+# Colors as RGBA tuples so Matplotlib does not re-parse a color string for every artist
+IDLE_COLOR, EDGE_COLOR, LABEL_COLOR = to_rgba("#d3d3d3"), to_rgba("black"), to_rgba("white")
+QUEUE_POLL_MS = 10  # how often the Tk loop checks for scheduling results
+TABLE_CHUNK = 500  # result rows inserted per Tk callback
+PROCESS_ENTRY = re.compile(r"\s*(\S+)\s+(\d+)\s+(\d+)\s+(\d+)\s*")  # PID arrival burst priority
+NUMBER_FIELD = re.compile(r"\d+")  # one arrival / burst / priority entry
+
+
+def gantt_geometry(timeline):
+    """Precompute segment geometry for a start-ordered (start, finish, pid) timeline.
+
+    Returns lists (starts, finishes, idle_starts). The idle gap drawn before
+    segment i spans [idle_starts[i], starts[i]), i.e. it starts where the
+    previous segment finished.
+    """
+    starts = [s for s, _, _ in timeline]
+    finishes = [f for _, f, _ in timeline]
+    idle_starts = [0] + finishes[:-1]
+    return starts, finishes, idle_starts
 
 
 class SchedulerGUI:
@@ -17,6 +43,15 @@ class SchedulerGUI:
         self.running = False
         self.paused = False
         self.speed = 1.0
+        self._after_id = None
+        self._frames = None
+        self._table_rows = None
+        self._scheduler = None
+        self._worker = None
+        self.ui_queue = queue.Queue()  # (scheduler, error) posted by the scheduling worker
+        self._artists = []
+        self._dirty = []  # animated artists changed since the last blit
+        self._background = None
 
         # ======================= TITLE ============================
         title = tk.Label(root, text="Heap-Based CPU Scheduler - Animated Gantt Chart with Idle Time",
@@ -66,7 +101,7 @@ class SchedulerGUI:
         self.algorithm.current(0)
         self.algorithm.grid(row=0, column=3, padx=5)
 
-        tk.Button(frame_options, text="Run Scheduler (Animated)", command=self.run_scheduler_thread,
+        tk.Button(frame_options, text="Run Scheduler (Animated)", command=self.run_scheduler_animated,
                   bg="#004080", fg="white", font=("Segoe UI", 10, "bold")).grid(row=0, column=4, padx=10)
         self.pause_btn = tk.Button(frame_options, text="Pause", command=self.toggle_pause,
                                    bg="#ff9933", fg="white", font=("Segoe UI", 10, "bold"))
@@ -129,6 +164,7 @@ class SchedulerGUI:
         self.fig, self.ax = plt.subplots(figsize=(10, 3))
         self.canvas = FigureCanvasTkAgg(self.fig, master=root)
         self.canvas.get_tk_widget().pack(pady=10)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
 
         # ======================= METRICS LABEL ====================
         self.metrics = tk.Label(root, text="", font=("Segoe UI", 11, "bold"), bg="#eaf0f6", fg="#003366")
@@ -141,22 +177,27 @@ class SchedulerGUI:
         self.speed = float(val)
 
     def add_process(self):
-        try:
-            pid = self.pid.get().strip()
-            if not pid:
-                raise ValueError
-            arrival = int(self.arrival.get())
-            burst = int(self.burst.get())
-            priority = int(self.priority.get())
-            ptype = self.ptype.get()
-            self.processes.append(Process(pid, arrival, burst, priority, ptype))
-            messagebox.showinfo("Success", f"Process {pid} added successfully.")
-            self.pid.delete(0, tk.END)
-            self.arrival.delete(0, tk.END)
-            self.burst.delete(0, tk.END)
-            self.priority.delete(0, tk.END)
-        except ValueError:
+        pid = self.pid.get().strip()
+        # A whole "PID arrival burst priority" line may also be typed into the PID field
+        if len(pid.split()) > 1:
+            match = PROCESS_ENTRY.fullmatch(pid)
+            fields = match.groups() if match else None
+        else:
+            # Separate fields are checked one by one so a value cannot spill into its neighbour
+            fields = (pid, self.arrival.get().strip(), self.burst.get().strip(), self.priority.get().strip())
+            if not pid or not all(NUMBER_FIELD.fullmatch(value) for value in fields[1:]):
+                fields = None
+        if fields is None:
             messagebox.showerror("Error", "Enter valid values (PID text, others numeric).")
+            return
+        pid, arrival, burst, priority = fields
+        ptype = self.ptype.get()
+        self.processes.append(Process(pid, int(arrival), int(burst), int(priority), ptype))
+        messagebox.showinfo("Success", f"Process {pid} added successfully.")
+        self.pid.delete(0, tk.END)
+        self.arrival.delete(0, tk.END)
+        self.burst.delete(0, tk.END)
+        self.priority.delete(0, tk.END)
 
     def generate_random(self):
         self.processes = generate_random_processes(5)
@@ -168,36 +209,86 @@ class SchedulerGUI:
         self.paused = not self.paused
         self.pause_btn.config(text="Resume" if self.paused else "Pause",
                               bg="#28a745" if self.paused else "#ff9933")
+        # Pausing just stops the frame chain; resuming restarts it. While the
+        # worker is still scheduling there is no chain yet, and the animation
+        # waits for the resume once the results are in.
+        if self.paused:
+            if self._after_id is not None:
+                self.root.after_cancel(self._after_id)
+                self._after_id = None
+        elif self._frames is not None:
+            self._start_frames()
 
-    def run_scheduler_thread(self):
+    def run_scheduler_animated(self):
         if self.running:
             return
-        t = threading.Thread(target=self.run_scheduler_animated)
-        t.start()
-
-    def run_scheduler_animated(self):
         if not self.processes:
             messagebox.showerror("Error", "No processes! Add or generate first.")
             return
 
         self.running = True
         scheduler = ProcessScheduler(self.processes, mode=self.mode.get(), algorithm=self.algorithm.get())
-        scheduler.schedule()
+        self._scheduler = scheduler
+        self._worker = threading.Thread(target=self._schedule_worker, args=(scheduler,), daemon=True)
+        self._worker.start()
+        self.root.after(QUEUE_POLL_MS, self._drain_queue)
 
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        for p in scheduler.completed:
-            self.tree.insert("", "end",
-                             values=(p.pid, p.process_type, p.arrival, p.burst,
-                                     p.priority, p.start, p.finish, p.waiting,
-                                     p.turnaround, p.response_time))
+    def _schedule_worker(self, scheduler):
+        """Run the scheduling algorithm off the Tk thread; never touches widgets"""
+        try:
+            scheduler.schedule()
+        except Exception as e:
+            self.ui_queue.put((scheduler, e))
+        else:
+            self.ui_queue.put((scheduler, None))
+
+    def _drain_queue(self):
+        """Apply results posted by the worker; keep polling while it is still running"""
+        alive = self._worker.is_alive()
+        while True:
+            try:
+                scheduler, error = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if scheduler is not self._scheduler:
+                continue  # the run was cleared before it finished
+            if error is not None:
+                self.running = False
+                messagebox.showerror("Error", f"Scheduling failed: {error}")
+            else:
+                self.show_results(scheduler)
+        if alive:
+            self.root.after(QUEUE_POLL_MS, self._drain_queue)
+
+    def show_results(self, scheduler):
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        # Rows are formatted up front and inserted in chunks, so a long table
+        # fills in behind the animation instead of blocking the UI
+        rows = [tuple(map(str, (p.pid, p.process_type, p.arrival, p.burst, p.priority,
+                                p.start, p.finish, p.waiting, p.turnaround, p.response_time)))
+                for p in scheduler.completed]
+        self._table_rows = rows
+        self._fill_table(rows, 0)
 
         self.animate_gantt_chart(scheduler)
 
-        # Display metrics
+    def _fill_table(self, rows, start):
+        if rows is not self._table_rows:
+            return  # superseded by a newer run or a clear
+        insert = self.tree.insert
+        for values in rows[start:start + TABLE_CHUNK]:
+            insert("", "end", values=values)
+        if start + TABLE_CHUNK < len(rows):
+            self.root.after(1, self._fill_table, rows, start + TABLE_CHUNK)
+
+    def show_metrics(self, scheduler):
         n = len(scheduler.completed)
-        avg_wait = sum(p.waiting for p in scheduler.completed) / n
-        avg_turn = sum(p.turnaround for p in scheduler.completed) / n
+        times = np.fromiter(((p.waiting, p.turnaround) for p in scheduler.completed),
+                            dtype=[("waiting", "i8"), ("turnaround", "i8")], count=n)
+        avg_wait = times["waiting"].mean()
+        avg_turn = times["turnaround"].mean()
         self.metrics.config(text=f"CPU Utilization: {scheduler.cpu_utilization:.2f}%   |   "
                                  f"Avg Waiting: {avg_wait:.2f}   |   Avg Turnaround: {avg_turn:.2f}   |   "
                                  f"Context Switches: {scheduler.context_switches}")
@@ -207,51 +298,129 @@ class SchedulerGUI:
     #                      ANIMATION LOGIC
     # =============================================================
     def animate_gantt_chart(self, scheduler):
+        """Set up the chart and start stepping frames on the Tk event loop"""
         self.ax.clear()
         self.ax.set_title("Animated Gantt Chart with CPU Idle Time", fontsize=11)
         self.ax.set_xlabel("Time")
         self.ax.set_ylabel("Processes / CPU")
-
-        colors = {}
-        y_process = 10
-        y_cpu = 5
-        current_time = 0
-        base_delay = 0.15
-
-        timeline = []
-        for p in scheduler.completed:
-            if p.start is not None:
-                timeline.append((p.start, p.finish, p.pid))
-        timeline.sort(key=lambda x: x[0])
-
-        for start, finish, pid in timeline:
-            if start > current_time:
-                for t in range(current_time, start):
-                    while self.paused:
-                        time.sleep(0.1)
-                    self.ax.barh(y_cpu, width=1, left=t, height=3, color="#d3d3d3", edgecolor="black")
-                    self.ax.text(t + 0.5, y_cpu, "IDLE", ha='center', va='center', fontsize=8)
-                    self.ax.set_xlim(0, finish + 2)
-                    self.ax.grid(True, axis='x', linestyle='--', alpha=0.6)
-                    self.canvas.draw()
-                    time.sleep(base_delay / self.speed)
-
-            if pid not in colors:
-                colors[pid] = "#" + ''.join(random.choices('0123456789ABCDEF', k=6))
-            for t in range(start, finish):
-                while self.paused:
-                    time.sleep(0.1)
-                self.ax.barh(y_process, width=1, left=t, height=3, color=colors[pid], edgecolor="black")
-                self.ax.text(t + 0.5, y_process, pid, ha='center', va='center', fontsize=9, color='white')
-                self.ax.set_xlim(0, finish + 2)
-                self.ax.grid(True, axis='x', linestyle='--', alpha=0.6)
-                self.canvas.draw()
-                time.sleep(base_delay / self.speed)
-            current_time = finish
-
-        self.ax.set_yticks([y_cpu, y_process])
+        self.ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+        # Fixed limits keep already-blitted bars in place as new ones are added
+        self.ax.set_ylim(Y_CPU - 2, Y_PROCESS + 2)
+        self.ax.set_yticks([Y_CPU, Y_PROCESS])
         self.ax.set_yticklabels(["CPU (Idle)", "Processes"])
-        self.canvas.draw()
+
+        timeline = scheduler.gantt_segments
+        geometry = gantt_geometry(timeline)
+        # The makespan is known up front, so the time axis is laid out once
+        # rather than widened (and the whole axes redrawn) segment by segment
+        x_max = max(geometry[1], default=0) + 2
+        self.ax.set_xlim(0, x_max)
+
+        # The static axes are rendered by the (idle) full draw and cached in
+        # _on_draw; each frame only restores that background and redraws the
+        # animated bars on top of it.
+        self._artists = []
+        self._dirty = []
+        self._background = None
+        self.canvas.draw_idle()
+
+        self._frames = self._gantt_frames(timeline, geometry)
+        if not self.paused:
+            self._start_frames()
+
+    def _start_frames(self):
+        """(Re)start the frame clock, e.g. after a pause, and queue the next step"""
+        self._next_frame = time.monotonic() + BASE_DELAY / self.speed
+        self._schedule_step()
+
+    def _schedule_step(self):
+        delay = max(self._next_frame - time.monotonic(), FRAME_INTERVAL)
+        self._after_id = self.root.after(int(delay * 1000), self._step)
+
+    def _step(self):
+        """Advance every time unit that is due, then draw a single frame"""
+        now = time.monotonic()
+        try:
+            # If drawing fell behind, catch the bars up and drop the intermediate frames
+            while True:
+                next(self._frames)
+                self._next_frame += BASE_DELAY / self.speed
+                if self._next_frame > now:
+                    break
+        except StopIteration:
+            self._after_id = None
+            self._frames = None
+            self._finish_animation()
+            return
+        self._blit_frame()
+        self._schedule_step()
+
+    def _gantt_frames(self, timeline, geometry):
+        """Update the animated bars one time unit at a time, yielding after each"""
+        # Colors come from a fixed colormap so repeated runs are drawn alike
+        pids = dict.fromkeys(pid for _, _, pid in timeline)
+        colors = {pid: plt.cm.tab20(i % 20) for i, pid in enumerate(pids)}
+        segments = zip(*geometry, (pid for _, _, pid in timeline))
+
+        for start, finish, idle_start, pid in segments:
+            if start > idle_start:
+                # Idle spans grow a single rectangle too
+                idle_bar, = self.ax.barh(Y_CPU, width=0, left=idle_start, height=3, color=IDLE_COLOR,
+                                         edgecolor=EDGE_COLOR, animated=True)
+                self._artists.append(idle_bar)
+                for t in range(idle_start, start):
+                    idle_bar.set_width(t - idle_start + 1)
+                    self._dirty.append(idle_bar)
+                    yield
+                # Labels go in once per span, centred, when the span is complete
+                self._add_animated(self.ax.text((idle_start + start) / 2, Y_CPU, "IDLE", ha='center',
+                                                va='center', fontsize=8, animated=True))
+
+            # One rectangle per segment that grows each step, rather than one per time unit
+            bar, = self.ax.barh(Y_PROCESS, width=0, left=start, height=3, color=colors[pid],
+                                edgecolor=EDGE_COLOR, animated=True)
+            self._artists.append(bar)
+            for t in range(start, finish - 1):
+                bar.set_width(t - start + 1)
+                self._dirty.append(bar)
+                yield
+            bar.set_width(finish - start)
+            self._dirty.append(bar)
+            self._add_animated(self.ax.text((start + finish) / 2, Y_PROCESS, pid, ha='center', va='center',
+                                            fontsize=9, color=LABEL_COLOR, animated=True))
+            yield
+
+    def _finish_animation(self):
+        # Hand the bars back to the regular draw so the final chart survives resizes
+        for artist in self._artists:
+            artist.set_animated(False)
+        self.canvas.draw_idle()
+        self.show_metrics(self._scheduler)
+
+    def _add_animated(self, *artists):
+        self._artists.extend(artists)
+        self._dirty.extend(artists)
+
+    def _on_draw(self, event):
+        """Re-capture the static background after every full redraw"""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._dirty = []  # a full redraw pushes the whole figure to Tk
+        for artist in self._artists:
+            if artist.get_animated():
+                self.ax.draw_artist(artist)
+
+    def _blit_frame(self):
+        """Restore the static background, redraw the animated bars and blit what changed"""
+        if self._background is None or not self._dirty:
+            return
+        self.canvas.restore_region(self._background)
+        for artist in self._artists:
+            self.ax.draw_artist(artist)
+        # Only the region touched since the last blit differs from what Tk shows
+        renderer = self.canvas.get_renderer()
+        dirty = Bbox.union([artist.get_window_extent(renderer) for artist in self._dirty])
+        self._dirty = []
+        self.canvas.blit(dirty.padded(2))
 
 
 # -------------------------- RUN GUI ----------------------------
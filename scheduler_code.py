@@ -1,13 +1,31 @@
+import csv
 import heapq
+import os
 import random
+import sys
 import time
 from typing import List
+from bisect import bisect_right
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import attrgetter
+
+# Comparisons over at least this many processes run each algorithm in its own
+# worker process (when there is more than one CPU); below it, starting the
+# workers costs more than it saves
+PARALLEL_COMPARE_MIN_PROCESSES = 50_000
+
+# One row of the results table; header and process rows share the column widths
+_ROW_FMT = "{:<8}{:<12}{:<10}{:<10}{:<10}{:<10}{:<10}{:<10}{:<12}{:<10}{:<10}"
 
 class Process:
     """Represents a process with comprehensive scheduling attributes"""
     
+    # Fixed attribute set: no per-instance __dict__, which matters for large workloads
+    __slots__ = ("pid", "arrival", "burst", "priority", "process_type", "remaining", "start", "finish",
+                 "waiting", "turnaround", "response_time", "context_switches", "execution_history", "state")
+    
     def __init__(self, pid, arrival, burst, priority, process_type="CPU"):
         self.pid = pid
         self.arrival = arrival
@@ -21,12 +39,20 @@ class Process:
         self.turnaround = 0
         self.response_time = None
         self.context_switches = 0
-        self.execution_history = []  # Track execution intervals
+        self.execution_history = []  # Track execution intervals as (start, end) pairs
         self.state = "NEW"  # NEW, READY, RUNNING, WAITING, TERMINATED
         
     def __repr__(self):
         return f"Process({self.pid}, Priority={self.priority}, Burst={self.burst})"
     
+    def record_execution(self, start, end):
+        """Record that the process ran over [start, end), merging with a contiguous previous run"""
+        history = self.execution_history
+        if history and history[-1][1] == start:
+            history[-1] = (history[-1][0], end)
+        else:
+            history.append((start, end))
+    
     def calculate_metrics(self):
         """Calculate all scheduling metrics"""
         if self.start is not None and self.finish is not None:
@@ -35,11 +61,20 @@ class Process:
             self.response_time = self.start - self.arrival
 
 
+def _is_sorted(processes):
+    """True when processes are already in arrival order"""
+    return all(a.arrival <= b.arrival for a, b in zip(processes, processes[1:]))
+
+
 class ProcessScheduler:
     """Advanced heap-based process scheduler with multiple features"""
     
-    def __init__(self, processes: List[Process], mode="preemptive", algorithm="priority"):
-        self.processes = sorted(processes, key=lambda p: p.arrival)
+    def __init__(self, processes: List[Process], mode="preemptive", algorithm="priority", verbose=False):
+        if _is_sorted(processes):
+            self.processes = list(processes)
+        else:
+            self.processes = sorted(processes, key=attrgetter("arrival"))
+        self._arrivals = [p.arrival for p in self.processes]  # Arrival times, bisected to admit processes
         self.mode = mode  # preemptive or non-preemptive
         self.algorithm = algorithm  # priority, sjf, fcfs
         self.timeline = []
@@ -48,98 +83,126 @@ class ProcessScheduler:
         self.cpu_utilization = 0
         self.throughput = 0
         self.idle_time = 0
+        self.verbose = verbose  # Fill execution_log only when it will be displayed
         self.execution_log = []
+        self.dispatch_order = []  # Processes in the order they first got the CPU
         
+    @property
+    def gantt_segments(self):
+        """(start, finish, pid) per process, already ordered by start time"""
+        return [(p.start, p.finish, p.pid) for p in self.dispatch_order]
+    
     def schedule(self):
         """Main scheduling algorithm with support for multiple scheduling types"""
+        # The algorithm is fixed for the whole run, so pick its loop once
+        dispatch = {"priority": self._run_priority, "sjf": self._run_sjf, "fcfs": self._run_fcfs}
+        if self.algorithm not in dispatch:
+            raise ValueError(f"Unknown algorithm: {self.algorithm!r}")
+        return dispatch[self.algorithm]()
+    
+    def _run_priority(self):
+        return self._heap_schedule(lambda p: (-p.priority, p.arrival, p.pid, p), self.mode == "preemptive")
+    
+    def _run_sjf(self):  # Shortest Job First
+        return self._heap_schedule(lambda p: (p.remaining, p.arrival, p.pid, p), self.mode == "preemptive")
+    
+    def _run_fcfs(self):  # First Come First Serve
+        # A later arrival can never go ahead of the running process
+        return self._heap_schedule(lambda p: (p.arrival, p.pid, p), False)
+    
+    def _heap_schedule(self, entry, preemptive):
+        """Run the heap scheduler; entry(proc) builds a ready-heap entry, smallest runs first"""
         clock = 0
         ready_heap = []
         process_index = 0
         running = None
-        total_processes = len(self.processes)
-        last_process = None
+        processes = self.processes
+        total_processes = len(processes)
+        arrivals = self._arrivals
+        prev_running_pid = None  # pid of the last process picked to run
+        # Looked up once here rather than on every event
+        heappush, heappop, heapreplace = heapq.heappush, heapq.heappop, heapq.heapreplace
+        verbose, log = self.verbose, self.execution_log.append
         
         while process_index < total_processes or ready_heap or running:
+            next_entry = None
             # Add all processes that have arrived by current clock time
-            while process_index < total_processes and self.processes[process_index].arrival <= clock:
-                proc = self.processes[process_index]
-                proc.state = "READY"
-                
-                # Different heap organization based on algorithm
-                if self.algorithm == "priority":
-                    heapq.heappush(ready_heap, (-proc.priority, proc.arrival, proc.pid, proc))
-                elif self.algorithm == "sjf":  # Shortest Job First
-                    heapq.heappush(ready_heap, (proc.remaining, proc.arrival, proc.pid, proc))
-                elif self.algorithm == "fcfs":  # First Come First Serve
-                    heapq.heappush(ready_heap, (proc.arrival, proc.pid, proc))
-                
-                self.execution_log.append(f"[Time {clock}] Process {proc.pid} arrived and added to ready queue")
-                process_index += 1
-            
-            # Preemptive check: if a higher priority/shorter process arrives
-            if running and self.mode == "preemptive" and ready_heap:
-                should_preempt = False
-                
-                if self.algorithm == "priority":
-                    highest_priority = -ready_heap[0][0]
-                    should_preempt = highest_priority > running.priority
-                elif self.algorithm == "sjf":
-                    shortest_remaining = ready_heap[0][0]
-                    should_preempt = shortest_remaining < running.remaining
-                
-                if should_preempt:
-                    # Preempt current process
-                    running.state = "READY"
-                    running.context_switches += 1
-                    self.context_switches += 1
+            arrived = bisect_right(arrivals, clock, process_index)
+            if arrived > process_index:
+                for proc in processes[process_index:arrived]:
+                    proc.state = "READY"
+                    heappush(ready_heap, entry(proc))
                     
-                    if self.algorithm == "priority":
-                        heapq.heappush(ready_heap, (-running.priority, running.arrival, running.pid, running))
-                    elif self.algorithm == "sjf":
-                        heapq.heappush(ready_heap, (running.remaining, running.arrival, running.pid, running))
+                    if verbose:
+                        log(f"[Time {clock}] Process {proc.pid} arrived and added to ready queue")
+                process_index = arrived
+                
+                # Preemptive check: only an arrival can bring in a higher priority/shorter process
+                if running and preemptive:
+                    running_entry = entry(running)
                     
-                    self.execution_log.append(f"[Time {clock}] Process {running.pid} preempted")
-                    running = None
+                    # Only a strictly better primary key (priority / remaining time) preempts
+                    if ready_heap[0][0] < running_entry[0]:
+                        # Preempt current process
+                        running.state = "READY"
+                        running.context_switches += 1
+                        self.context_switches += 1
+                        
+                        # The preempting process is taken off the top in the same sift
+                        # that puts the preempted one back
+                        next_entry = heapreplace(ready_heap, running_entry)
+                        
+                        if verbose:
+                            log(f"[Time {clock}] Process {running.pid} preempted")
+                        running = None
             
             # If no process is running, get next from heap
             if not running and ready_heap:
-                if self.algorithm == "fcfs":
-                    _, _, running = heapq.heappop(ready_heap)
-                else:
-                    *_, running = heapq.heappop(ready_heap)
+                if next_entry is None:
+                    next_entry = heappop(ready_heap)
+                running = next_entry[-1]
                 
                 running.state = "RUNNING"
                 
                 if running.start is None:
                     running.start = clock
                     running.response_time = clock - running.arrival
+                    self.dispatch_order.append(running)
                 
-                # Track context switch
-                if last_process and last_process.pid != running.pid:
+                # Track context switch; running only changes here, so this is the only check
+                if prev_running_pid is not None and prev_running_pid != running.pid:
                     self.context_switches += 1
+                prev_running_pid = running.pid
                 
-                self.execution_log.append(f"[Time {clock}] Process {running.pid} started/resumed execution")
+                if verbose:
+                    log(f"[Time {clock}] Process {running.pid} started/resumed execution")
             
-            # Execute the running process for 1 time unit
+            # Only an arrival can preempt, so run straight through to whichever
+            # comes first: the next arrival or the running process completing
             if running:
-                running.remaining -= 1
-                running.execution_history.append(clock)
-                last_process = running
+                run_for = running.remaining
+                if process_index < total_processes:
+                    run_for = min(run_for, arrivals[process_index] - clock)
+                running.remaining -= run_for
+                running.record_execution(clock, clock + run_for)
+                clock += run_for
                 
                 # If process completes
                 if running.remaining == 0:
-                    running.finish = clock + 1
+                    running.finish = clock
                     running.state = "TERMINATED"
                     running.calculate_metrics()
                     self.completed.append(running)
-                    self.execution_log.append(f"[Time {clock + 1}] Process {running.pid} completed")
+                    if verbose:
+                        log(f"[Time {clock}] Process {running.pid} completed")
                     running = None
             else:
-                # CPU idle
-                self.idle_time += 1
-                self.execution_log.append(f"[Time {clock}] CPU idle")
-            
-            clock += 1
+                # CPU idle until the next arrival; the loop only gets here while one is pending
+                idle_until = arrivals[process_index]
+                self.idle_time += idle_until - clock
+                if verbose:
+                    log(f"[Time {clock}] CPU idle until {idle_until}")
+                clock = idle_until
         
         # Calculate overall metrics
         self.calculate_system_metrics(clock)
@@ -153,43 +216,48 @@ class ProcessScheduler:
     
     def display_results(self):
         """Display comprehensive scheduling results and metrics"""
-        print("\n" + "="*120)
-        print(f"{'PROCESS SCHEDULING RESULTS':^120}")
-        print(f"{'Mode: ' + self.mode.upper() + ' | Algorithm: ' + self.algorithm.upper():^120}")
-        print("="*120)
+        # Collect the lines and write them in one go rather than one print per row
+        lines = []
+        out = lines.append
+        out("\n" + "="*120)
+        out(f"{'PROCESS SCHEDULING RESULTS':^120}")
+        out(f"{'Mode: ' + self.mode.upper() + ' | Algorithm: ' + self.algorithm.upper():^120}")
+        out("="*120)
         
-        print(f"\n{'PID':<8}{'Type':<12}{'Arrival':<10}{'Burst':<10}{'Priority':<10}{'Start':<10}"
-              f"{'Finish':<10}{'Waiting':<10}{'Turnaround':<12}{'Response':<10}{'Switches':<10}")
-        print("-"*120)
+        row = _ROW_FMT.format
+        out("\n" + row('PID', 'Type', 'Arrival', 'Burst', 'Priority', 'Start',
+                       'Finish', 'Waiting', 'Turnaround', 'Response', 'Switches'))
+        out("-"*120)
         
         total_waiting = 0
         total_turnaround = 0
         total_response = 0
         
         for proc in self.completed:
-            print(f"{proc.pid:<8}{proc.process_type:<12}{proc.arrival:<10}{proc.burst:<10}"
-                  f"{proc.priority:<10}{proc.start:<10}{proc.finish:<10}{proc.waiting:<10}"
-                  f"{proc.turnaround:<12}{proc.response_time:<10}{proc.context_switches:<10}")
+            out(row(proc.pid, proc.process_type, proc.arrival, proc.burst,
+                    proc.priority, proc.start, proc.finish, proc.waiting,
+                    proc.turnaround, proc.response_time, proc.context_switches))
             total_waiting += proc.waiting
             total_turnaround += proc.turnaround
             total_response += proc.response_time
         
-        print("-"*120)
+        out("-"*120)
         n = len(self.completed)
         avg_waiting = total_waiting / n if n > 0 else 0
         avg_turnaround = total_turnaround / n if n > 0 else 0
         avg_response = total_response / n if n > 0 else 0
         
-        print(f"\n{'PERFORMANCE METRICS':^120}")
-        print("-"*120)
-        print(f"Average Waiting Time:      {avg_waiting:.2f} time units")
-        print(f"Average Turnaround Time:   {avg_turnaround:.2f} time units")
-        print(f"Average Response Time:     {avg_response:.2f} time units")
-        print(f"CPU Utilization:           {self.cpu_utilization:.2f}%")
-        print(f"Throughput:                {self.throughput:.4f} processes/time unit")
-        print(f"Total Context Switches:    {self.context_switches}")
-        print(f"Total Idle Time:           {self.idle_time} time units")
-        print("="*120 + "\n")
+        out(f"\n{'PERFORMANCE METRICS':^120}")
+        out("-"*120)
+        out(f"Average Waiting Time:      {avg_waiting:.2f} time units")
+        out(f"Average Turnaround Time:   {avg_turnaround:.2f} time units")
+        out(f"Average Response Time:     {avg_response:.2f} time units")
+        out(f"CPU Utilization:           {self.cpu_utilization:.2f}%")
+        out(f"Throughput:                {self.throughput:.4f} processes/time unit")
+        out(f"Total Context Switches:    {self.context_switches}")
+        out(f"Total Idle Time:           {self.idle_time} time units")
+        out("="*120 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_gantt_chart(self):
         """Display a visual Gantt chart"""
@@ -209,13 +277,15 @@ class ProcessScheduler:
     
     def display_execution_log(self, max_lines=20):
         """Display execution log"""
-        print("\nEXECUTION LOG (First {} entries):".format(max_lines))
-        print("-" * 100)
-        for i, log in enumerate(self.execution_log[:max_lines]):
-            print(log)
+        lines = []
+        out = lines.append
+        out("\nEXECUTION LOG (First {} entries):".format(max_lines))
+        out("-" * 100)
+        lines.extend(self.execution_log[:max_lines])
         if len(self.execution_log) > max_lines:
-            print(f"... and {len(self.execution_log) - max_lines} more entries")
-        print("-" * 100 + "\n")
+            out(f"... and {len(self.execution_log) - max_lines} more entries")
+        out("-" * 100 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def compare_with_other_algorithms(self, original_processes):
         """Compare current algorithm with other scheduling algorithms"""
@@ -226,23 +296,35 @@ class ProcessScheduler:
         algorithms = ["priority", "sjf", "fcfs"]
         results = {}
         
-        for algo in algorithms:
-            # Create fresh copies of processes
-            test_processes = [Process(p.pid, p.arrival, p.burst, p.priority, p.process_type) 
-                            for p in original_processes]
-            
-            scheduler = ProcessScheduler(test_processes, mode=self.mode, algorithm=algo)
-            scheduler.schedule()
-            
-            n = len(scheduler.completed)
-            avg_waiting = sum(p.waiting for p in scheduler.completed) / n if n > 0 else 0
-            avg_turnaround = sum(p.turnaround for p in scheduler.completed) / n if n > 0 else 0
-            
+        # Only the totals are reported, so the runs go through the integer
+        # kernel instead of full schedulers with Process state
+        if _is_sorted(original_processes):
+            ordered = original_processes
+        else:
+            ordered = sorted(original_processes, key=attrgetter("arrival"))
+        arrivals = [p.arrival for p in ordered]
+        bursts = [p.burst for p in ordered]
+        priorities = [p.priority for p in ordered]
+        pids = [p.pid for p in ordered]
+        n = len(ordered)
+        preemptive = self.mode == "preemptive"
+        
+        workers = min(len(algorithms), os.cpu_count() or 1)
+        if workers > 1 and n >= PARALLEL_COMPARE_MIN_PROCESSES:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_simulate_totals, arrivals, bursts, priorities, pids, algo, preemptive)
+                           for algo in algorithms]
+                totals = [future.result() for future in futures]
+        else:
+            totals = [_simulate_totals(arrivals, bursts, priorities, pids, algo, preemptive)
+                      for algo in algorithms]
+        
+        for algo, (total_waiting, total_turnaround, context_switches, idle_time, total_time) in zip(algorithms, totals):
             results[algo] = {
-                'avg_waiting': avg_waiting,
-                'avg_turnaround': avg_turnaround,
-                'cpu_util': scheduler.cpu_utilization,
-                'context_switches': scheduler.context_switches
+                'avg_waiting': total_waiting / n if n > 0 else 0,
+                'avg_turnaround': total_turnaround / n if n > 0 else 0,
+                'cpu_util': (total_time - idle_time) / total_time * 100 if total_time > 0 else 0,
+                'context_switches': context_switches
             }
         
         print(f"\n{'Algorithm':<15}{'Avg Waiting':<18}{'Avg Turnaround':<20}{'CPU Util %':<15}{'Context Switches':<20}")
@@ -257,31 +339,90 @@ class ProcessScheduler:
     def export_to_csv(self, filename="scheduling_results.csv"):
         """Export results to CSV file"""
         try:
-            with open(filename, 'w') as f:
-                f.write("PID,Type,Arrival,Burst,Priority,Start,Finish,Waiting,Turnaround,Response,ContextSwitches\n")
-                for proc in self.completed:
-                    f.write(f"{proc.pid},{proc.process_type},{proc.arrival},{proc.burst},{proc.priority},"
-                           f"{proc.start},{proc.finish},{proc.waiting},{proc.turnaround},"
-                           f"{proc.response_time},{proc.context_switches}\n")
+            with open(filename, 'w', newline="", buffering=1 << 20) as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(["PID", "Type", "Arrival", "Burst", "Priority", "Start", "Finish",
+                                 "Waiting", "Turnaround", "Response", "ContextSwitches"])
+                writer.writerows((proc.pid, proc.process_type, proc.arrival, proc.burst, proc.priority,
+                                  proc.start, proc.finish, proc.waiting, proc.turnaround,
+                                  proc.response_time, proc.context_switches) for proc in self.completed)
             print(f"✓ Results exported to {filename}")
         except Exception as e:
             print(f"✗ Error exporting to CSV: {e}")
 
 
+def _simulate_totals(arrivals, bursts, priorities, pids, algorithm, preemptive):
+    """Replay ProcessScheduler.schedule on plain per-process lists sorted by arrival.
+    
+    Returns (total_waiting, total_turnaround, context_switches, idle_time, total_time),
+    with context switches counted exactly as schedule() counts them.
+    """
+    n = len(arrivals)
+    remaining = list(bursts)
+    started = [False] * n
+    ready_heap = []
+    clock = index = 0
+    running = last = -1  # last: the process picked before running
+    total_waiting = total_turnaround = context_switches = idle_time = 0
+    preemptive = preemptive and algorithm != "fcfs"
+    heappush, heappop, heapreplace = heapq.heappush, heapq.heappop, heapq.heapreplace
+    # Heap keys mirror schedule(); FCFS's (arrival, pid) becomes (arrival, arrival, pid).
+    # SJF keys on the live remaining times, which hold the full burst until a process first runs.
+    keys = {"priority": [-p for p in priorities], "sjf": remaining, "fcfs": arrivals}[algorithm]
+    
+    while index < n or ready_heap or running >= 0:
+        next_entry = None
+        arrived = bisect_right(arrivals, clock, index)
+        if arrived > index:
+            for i in range(index, arrived):
+                heappush(ready_heap, (keys[i], arrivals[i], pids[i], i))
+            index = arrived
+            
+            # As in schedule(), only a new arrival can preempt
+            if running >= 0 and preemptive:
+                key = keys[running]
+                if ready_heap[0][0] < key:
+                    context_switches += 1
+                    next_entry = heapreplace(ready_heap, (key, arrivals[running], pids[running], running))
+                    running = -1
+        
+        if running < 0 and ready_heap:
+            if next_entry is None:
+                next_entry = heappop(ready_heap)
+            running = next_entry[3]
+            if not started[running]:
+                started[running] = True
+                total_waiting += clock - arrivals[running]
+            if last >= 0 and pids[last] != pids[running]:
+                context_switches += 1
+            last = running
+        
+        if running >= 0:
+            run_for = remaining[running]
+            if index < n:
+                run_for = min(run_for, arrivals[index] - clock)
+            remaining[running] -= run_for
+            clock += run_for
+            if remaining[running] == 0:
+                total_turnaround += clock - arrivals[running]
+                running = -1
+        else:
+            idle_until = arrivals[index]
+            idle_time += idle_until - clock
+            clock = idle_until
+    
+    return total_waiting, total_turnaround, context_switches, idle_time, clock
+
+
 def generate_random_processes(n=10):
     """Generate random processes for testing"""
-    processes = []
-    process_types = ["CPU", "I/O"]
-    
-    for i in range(n):
-        pid = f"P{i+1}"
-        arrival = random.randint(0, 10)
-        burst = random.randint(1, 10)
-        priority = random.randint(1, 5)
-        proc_type = random.choice(process_types)
-        processes.append(Process(pid, arrival, burst, priority, proc_type))
-    
-    return processes
+    # Draw each column in one batched call rather than four calls per process
+    arrivals = random.choices(range(0, 11), k=n)
+    bursts = random.choices(range(1, 11), k=n)
+    priorities = random.choices(range(1, 6), k=n)
+    types = random.choices(["CPU", "I/O"], k=n)
+    return [Process(f"P{i+1}", arrival, burst, priority, ptype)
+            for i, (arrival, burst, priority, ptype) in enumerate(zip(arrivals, bursts, priorities, types))]
 
 
 def run_predefined_examples():
@@ -303,7 +444,7 @@ def run_predefined_examples():
         Process('P5', 4, 2, 5, "I/O")
     ]
     
-    scheduler1 = ProcessScheduler(processes1, mode="preemptive", algorithm="priority")
+    scheduler1 = ProcessScheduler(processes1, mode="preemptive", algorithm="priority", verbose=True)
     scheduler1.schedule()
     scheduler1.display_results()
     scheduler1.display_gantt_chart()
@@ -434,7 +575,7 @@ def interactive_mode():
                 break
             print("❌ Invalid algorithm! Please enter 'priority', 'sjf', or 'fcfs'.")
         
-        custom_scheduler = ProcessScheduler(custom_processes, mode=mode, algorithm=algorithm)
+        custom_scheduler = ProcessScheduler(custom_processes, mode=mode, algorithm=algorithm, verbose=True)
         custom_scheduler.schedule()
         custom_scheduler.display_results()
         custom_scheduler.display_gantt_chart()
@@ -1,13 +1,26 @@
 import heapq
+import os
 import random
+from bisect import bisect_right
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 from datetime import datetime
+from operator import attrgetter
+
+# Comparisons over at least this many processes run each algorithm in its own
+# worker process (when there is more than one CPU); below it, starting the
+# workers costs more than it saves
+PARALLEL_COMPARE_MIN_PROCESSES = 10_000
 
 
 class Process:
     """Represents a process with comprehensive scheduling attributes"""
 
+    # Fixed attribute set, no per-instance __dict__
+    __slots__ = ("pid", "arrival", "burst", "priority", "process_type", "remaining", "start", "finish",
+                 "waiting", "turnaround", "response_time", "context_switches", "execution_history", "state")
+
     def __init__(self, pid, arrival, burst, priority, process_type="CPU"):
         self.pid = pid
         self.arrival = arrival
@@ -21,28 +34,45 @@ class Process:
         self.turnaround = 0
         self.response_time = None
         self.context_switches = 0
-        self.execution_history = []
+        self.execution_history = []  # (start, end) intervals the process ran for
         self.state = "NEW"
 
     def __repr__(self):
         return f"Process({self.pid}, Priority={self.priority}, Burst={self.burst})"
 
+    def record_execution(self, start, end):
+        """Record a run over [start, end), merging with a contiguous previous run"""
+        history = self.execution_history
+        if history and history[-1][1] == start:
+            history[-1] = (history[-1][0], end)
+        else:
+            history.append((start, end))
+
     def calculate_metrics(self):
         """Accurate waiting, turnaround, and response calculations"""
         if self.start is not None and self.finish is not None:
             # Total CPU active time = total execution intervals
-            active_time = len(self.execution_history)
+            active_time = sum(end - start for start, end in self.execution_history)
             self.turnaround = self.finish - self.arrival
             self.waiting = self.turnaround - active_time
             if self.response_time is None:
                 self.response_time = self.start - self.arrival
 
 
+def _is_sorted(processes):
+    """True when processes are already in arrival order"""
+    return all(a.arrival <= b.arrival for a, b in zip(processes, processes[1:]))
+
+
 class ProcessScheduler:
     """Advanced heap-based scheduler with Round Robin support"""
 
-    def __init__(self, processes: List[Process], mode="preemptive", algorithm="priority", quantum=2):
-        self.processes = sorted(processes, key=lambda p: p.arrival)
+    def __init__(self, processes: List[Process], mode="preemptive", algorithm="priority", quantum=2, verbose=False, _presorted=False):
+        if _presorted or _is_sorted(processes):
+            self.processes = list(processes)
+        else:
+            self.processes = sorted(processes, key=attrgetter("arrival"))
+        self._arrivals = [p.arrival for p in self.processes]  # arrival times, bisected to admit processes
         self.mode = mode
         self.algorithm = algorithm.lower()
         self.quantum = quantum
@@ -51,85 +81,108 @@ class ProcessScheduler:
         self.cpu_utilization = 0
         self.throughput = 0
         self.idle_time = 0
+        self.verbose = verbose  # fill execution_log only when it will be displayed
         self.execution_log = []
+        self.dispatch_order = []  # processes in the order they first got the CPU
+
+    @property
+    def gantt_segments(self):
+        """(start, finish, pid) per process, already ordered by start time"""
+        return [(p.start, p.finish, p.pid) for p in self.dispatch_order]
 
     def schedule(self):
         """Main scheduling entry point"""
-        if self.algorithm == "rr":
-            return self._round_robin()
-        else:
-            return self._heap_based_schedule()
+        # Pick the algorithm's loop once instead of comparing strings on every event
+        dispatch = {"priority": self._run_priority, "sjf": self._run_sjf,
+                    "fcfs": self._run_fcfs, "rr": self._round_robin}
+        if self.algorithm not in dispatch:
+            raise ValueError(f"Unknown algorithm: {self.algorithm!r}")
+        return dispatch[self.algorithm]()
 
     # ===============================================================
     # HEAP-BASED SCHEDULERS: PRIORITY, SJF, FCFS
     # ===============================================================
-    def _heap_based_schedule(self):
+    def _run_priority(self):
+        return self._heap_based_schedule(lambda p: (-p.priority, p.arrival, p.pid, p),
+                                         self.mode == "preemptive")
+
+    def _run_sjf(self):
+        return self._heap_based_schedule(lambda p: (p.remaining, p.arrival, p.pid, p),
+                                         self.mode == "preemptive")
+
+    def _run_fcfs(self):
+        # A later arrival can never go ahead of the running process
+        return self._heap_based_schedule(lambda p: (p.arrival, p.pid, p), False)
+
+    def _heap_based_schedule(self, entry, preemptive):
+        """entry(proc) builds the ready-heap entry; the smallest entry runs first"""
         clock = 0
         ready_heap = []
         process_index = 0
         running = None
-        total_processes = len(self.processes)
-        last_process = None
+        processes = self.processes
+        total_processes = len(processes)
+        arrivals = self._arrivals
+        prev_running_pid = None  # pid of the last process picked to run
+        # Looked up once here rather than on every event
+        heappush, heappop, heapreplace = heapq.heappush, heapq.heappop, heapq.heapreplace
+        verbose, log = self.verbose, self.execution_log.append
 
         while process_index < total_processes or ready_heap or running:
+            next_entry = None
             # Add processes that have arrived
-            while process_index < total_processes and self.processes[process_index].arrival <= clock:
-                proc = self.processes[process_index]
-                proc.state = "READY"
-                if self.algorithm == "priority":
-                    heapq.heappush(ready_heap, (-proc.priority, proc.arrival, proc.pid, proc))
-                elif self.algorithm == "sjf":
-                    heapq.heappush(ready_heap, (proc.remaining, proc.arrival, proc.pid, proc))
-                elif self.algorithm == "fcfs":
-                    heapq.heappush(ready_heap, (proc.arrival, proc.pid, proc))
-                self.execution_log.append(f"[Time {clock}] {proc.pid} arrived")
-                process_index += 1
-
-            # Preemption check
-            if running and self.mode == "preemptive" and ready_heap:
-                should_preempt = False
-                if self.algorithm == "priority":
-                    highest_priority = -ready_heap[0][0]
-                    should_preempt = highest_priority > running.priority
-                elif self.algorithm == "sjf":
-                    shortest = ready_heap[0][0]
-                    should_preempt = shortest < running.remaining
-                if should_preempt:
-                    running.state = "READY"
-                    heapq.heappush(
-                        ready_heap,
-                        (-running.priority if self.algorithm == "priority" else running.remaining,
-                         running.arrival, running.pid, running),
-                    )
-                    running = None
-                    self.context_switches += 1
+            arrived = bisect_right(arrivals, clock, process_index)
+            if arrived > process_index:
+                for proc in processes[process_index:arrived]:
+                    proc.state = "READY"
+                    heappush(ready_heap, entry(proc))
+                    if verbose:
+                        log(f"[Time {clock}] {proc.pid} arrived")
+                process_index = arrived
+
+                # Preemption check; only a new arrival can preempt
+                if running and preemptive:
+                    running_entry = entry(running)
+                    # Only a strictly better priority / remaining time preempts
+                    if ready_heap[0][0] < running_entry[0]:
+                        running.state = "READY"
+                        # Take the preempting process off the top while putting this one back
+                        next_entry = heapreplace(ready_heap, running_entry)
+                        running = None
+                        self.context_switches += 1
 
             # Pick next process if CPU is idle
             if not running and ready_heap:
-                if self.algorithm == "fcfs":
-                    _, _, running = heapq.heappop(ready_heap)
-                else:
-                    *_, running = heapq.heappop(ready_heap)
+                if next_entry is None:
+                    next_entry = heappop(ready_heap)
+                running = next_entry[-1]
                 if running.start is None:
                     running.start = clock
+                    self.dispatch_order.append(running)
                 running.state = "RUNNING"
-                if last_process and last_process.pid != running.pid:
+                if prev_running_pid is not None and prev_running_pid != running.pid:
                     self.context_switches += 1
-                last_process = running
+                prev_running_pid = running.pid
 
-            # Execute one time unit
+            # Run until the next arrival (the only thing that can preempt) or completion
             if running:
-                running.remaining -= 1
-                running.execution_history.append(clock)
+                run_for = running.remaining
+                if process_index < total_processes:
+                    run_for = min(run_for, arrivals[process_index] - clock)
+                running.remaining -= run_for
+                running.record_execution(clock, clock + run_for)
+                clock += run_for
                 if running.remaining == 0:
-                    running.finish = clock + 1
+                    running.finish = clock
                     running.state = "TERMINATED"
                     running.calculate_metrics()
                     self.completed.append(running)
                     running = None
             else:
-                self.idle_time += 1
-            clock += 1
+                # Idle until the next arrival; the loop only gets here while one is pending
+                idle_until = arrivals[process_index]
+                self.idle_time += idle_until - clock
+                clock = idle_until
 
         self.calculate_system_metrics(clock)
         return self.completed
@@ -141,46 +194,60 @@ class ProcessScheduler:
         clock = 0
         ready_queue = deque()
         process_index = 0
-        total_processes = len(self.processes)
+        processes = self.processes
+        total_processes = len(processes)
+        arrivals = self._arrivals
         quantum = self.quantum
+        # Looked up once here rather than on every pass
+        enqueue, dequeue = ready_queue.append, ready_queue.popleft
+        verbose, log = self.verbose, self.execution_log.append
 
         while process_index < total_processes or ready_queue:
             # Add processes that arrived
-            while process_index < total_processes and self.processes[process_index].arrival <= clock:
-                proc = self.processes[process_index]
+            arrived = bisect_right(arrivals, clock, process_index)
+            for proc in processes[process_index:arrived]:
                 proc.state = "READY"
-                ready_queue.append(proc)
-                self.execution_log.append(f"[Time {clock}] {proc.pid} arrived")
-                process_index += 1
+                enqueue(proc)
+                if verbose:
+                    log(f"[Time {clock}] {proc.pid} arrived")
+            process_index = arrived
 
             if not ready_queue:
-                self.execution_log.append(f"[Time {clock}] CPU idle")
-                self.idle_time += 1
-                clock += 1
+                # Nothing to run until the next arrival
+                idle_until = arrivals[process_index]
+                if verbose:
+                    log(f"[Time {clock}] CPU idle until {idle_until}")
+                self.idle_time += idle_until - clock
+                clock = idle_until
                 continue
 
-            proc = ready_queue.popleft()
+            proc = dequeue()
             if proc.start is None:
                 proc.start = clock
                 proc.response_time = clock - proc.arrival
+                self.dispatch_order.append(proc)
 
-            self.execution_log.append(f"[Time {clock}] {proc.pid} executing")
+            if verbose:
+                log(f"[Time {clock}] {proc.pid} executing")
+            # A quantum runs in one step; anything arriving during it is queued at
+            # the next pass, behind this process if it still has work left
             exec_time = min(quantum, proc.remaining)
-            for _ in range(exec_time):
-                proc.execution_history.append(clock)
-                clock += 1
+            proc.record_execution(clock, clock + exec_time)
+            clock += exec_time
 
             proc.remaining -= exec_time
 
             if proc.remaining > 0:
-                ready_queue.append(proc)
-                self.execution_log.append(f"[Time {clock}] {proc.pid} preempted")
+                enqueue(proc)
+                if verbose:
+                    log(f"[Time {clock}] {proc.pid} preempted")
             else:
                 proc.finish = clock
                 proc.calculate_metrics()
                 proc.state = "TERMINATED"
                 self.completed.append(proc)
-                self.execution_log.append(f"[Time {clock}] {proc.pid} finished")
+                if verbose:
+                    log(f"[Time {clock}] {proc.pid} finished")
 
             self.context_switches += 1
 
@@ -204,26 +271,41 @@ class ProcessScheduler:
         print("\nALGORITHM COMPARISON\n" + "-" * 80)
         print(f"{'Algorithm':<15}{'Avg Waiting':<18}{'Avg Turnaround':<20}{'CPU Util %':<15}{'Context Switches':<20}")
         print("-" * 80)
-        for algo in algorithms:
-            test_procs = [Process(p.pid, p.arrival, p.burst, p.priority, p.process_type) for p in original_processes]
-            scheduler = ProcessScheduler(test_procs, mode=self.mode, algorithm=algo.lower(), quantum=self.quantum)
-            scheduler.schedule()
-            n = len(scheduler.completed)
-            avg_w = sum(p.waiting for p in scheduler.completed) / n
-            avg_t = sum(p.turnaround for p in scheduler.completed) / n
-            print(f"{algo:<15}{avg_w:<18.2f}{avg_t:<20.2f}{scheduler.cpu_utilization:<15.2f}{scheduler.context_switches:<20}")
+        # Runs get plain (pid, arrival, burst, priority, type) tuples sorted once by
+        # arrival; they pickle far cheaper than Process objects for the workers
+        if not _is_sorted(original_processes):
+            original_processes = sorted(original_processes, key=attrgetter("arrival"))
+        specs = [(p.pid, p.arrival, p.burst, p.priority, p.process_type) for p in original_processes]
+        workers = min(len(algorithms), os.cpu_count() or 1)
+        if workers > 1 and len(specs) >= PARALLEL_COMPARE_MIN_PROCESSES:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_compare_run, specs, self.mode, algo.lower(), self.quantum)
+                           for algo in algorithms]
+                results = [future.result() for future in futures]
+        else:
+            results = [_compare_run(specs, self.mode, algo.lower(), self.quantum) for algo in algorithms]
+        for algo, (avg_w, avg_t, cpu_util, context_switches) in zip(algorithms, results):
+            print(f"{algo:<15}{avg_w:<18.2f}{avg_t:<20.2f}{cpu_util:<15.2f}{context_switches:<20}")
+
+
+def _compare_run(specs, mode, algorithm, quantum):
+    """One comparison run over arrival-sorted process tuples; module-level so workers can unpickle it"""
+    processes = [Process(*spec) for spec in specs]
+    scheduler = ProcessScheduler(processes, mode=mode, algorithm=algorithm, quantum=quantum, _presorted=True)
+    scheduler.schedule()
+    n = len(scheduler.completed)
+    avg_w = sum(p.waiting for p in scheduler.completed) / n
+    avg_t = sum(p.turnaround for p in scheduler.completed) / n
+    return avg_w, avg_t, scheduler.cpu_utilization, scheduler.context_switches
 
 
 # ===============================================================
 # RANDOM PROCESS GENERATOR
 # ===============================================================
 def generate_random_processes(n=10):
-    processes = []
-    for i in range(n):
-        pid = f"P{i+1}"
-        arrival = random.randint(0, 10)
-        burst = random.randint(1, 10)
-        priority = random.randint(1, 5)
-        ptype = random.choice(["CPU", "I/O"])
-        processes.append(Process(pid, arrival, burst, priority, ptype))
-    return processes
+    arrivals = random.choices(range(0, 11), k=n)
+    bursts = random.choices(range(1, 11), k=n)
+    priorities = random.choices(range(1, 6), k=n)
+    ptypes = random.choices(["CPU", "I/O"], k=n)
+    return [Process(f"P{i+1}", arrival, burst, priority, ptype)
+            for i, (arrival, burst, priority, ptype) in enumerate(zip(arrivals, bursts, priorities, ptypes))]